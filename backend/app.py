@@ -4,23 +4,48 @@ A FastAPI-based REST API for managing todo items with PostgreSQL database.
 This application provides CRUD operations for todos, system logging, and database inspection capabilities.
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Body, FastAPI, HTTPException, Path, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, conint, field_validator
+import asyncpg
+import asyncio
 import os
 import logging
+import queue
 import time
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from collections import deque
+from itertools import islice
+from datetime import date, datetime
 from typing import List, Optional
-import json
+from cachetools import TTLCache
 
-# Configure logging for the application
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configure logging for the application.
+# Request handlers only merge the message arguments and enqueue the record;
+# a background listener thread adds the timestamp/level prefix and writes
+# to stderr, keeping stream I/O off the event loop.
+# `python app.py` imports this module twice (as __main__, then as "app" via
+# uvicorn), so reuse the root QueueHandler if an earlier import installed one.
+log_queue_handler = next(
+    (h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)),
+    None
 )
+if log_queue_handler is None:
+    log_queue_handler = QueueHandler(queue.SimpleQueue())
+    log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[log_queue_handler]
+    )
+
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+# Started and stopped by the app's startup/shutdown hooks; records logged
+# before startup wait in the queue until the listener runs.
+log_listener = QueueListener(log_queue_handler.queue, log_stream_handler)
 logger = logging.getLogger("TodoAPI")
 
 # Initialize FastAPI application
@@ -29,7 +54,8 @@ app = FastAPI(
     description="Docker Todo App with FastAPI - A comprehensive todo management system",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS middleware to allow frontend communication
@@ -41,15 +67,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global list to store system request logs (in-memory storage)
-system_logs = []
+# Global ring buffer holding the last 100 request logs (in-memory storage)
+system_logs = deque(maxlen=100)
+
+# Number of Uvicorn worker processes (WEB_CONCURRENCY, default 1)
+WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+# Short-lived cache for read endpoints; cleared whenever todos change.
+# Each worker only clears its own copy, so the cache is only used with a
+# single worker, where a write is always visible to the next read.
+RESPONSE_CACHE_ENABLED = WEB_CONCURRENCY == 1
+response_cache = TTLCache(maxsize=32, ttl=2.0)
+
+# Bumped by every write. A read only stores its result if no write happened
+# while it was awaiting the database, so stale rows never refill the cache.
+_cache_generation = 0
+
+def invalidate_response_cache():
+    """Drop cached read responses after a write to the todos table."""
+    global _cache_generation
+    _cache_generation += 1
+    response_cache.clear()
+
+# Most recently formatted timestamp, reused for every request within the same second
+_ts_cache = {"sec": 0, "iso": ""}
+
+def current_timestamp():
+    """Return the current local time as an ISO string at one-second granularity.
+    
+    The string is rebuilt only when the wall-clock second changes, so requests
+    arriving within the same second share one formatted timestamp.
+    
+    Returns:
+        str: ISO 8601 timestamp for the current second
+    """
+    sec = int(time.time())
+    if sec != _ts_cache["sec"]:
+        _ts_cache["iso"] = datetime.fromtimestamp(sec).isoformat()
+        _ts_cache["sec"] = sec
+    return _ts_cache["iso"]
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """HTTP middleware to log all incoming requests and responses.
     
     This middleware captures:
-    - Request method, URL, client IP, and user agent
+    - Request method, path (with query string), client IP, and user agent
     - Response status code, processing time, and content length
     - Stores logs in memory for monitoring purposes
     
@@ -60,32 +123,32 @@ async def log_requests(request: Request, call_next):
     Returns:
         Response: HTTP response with added logging
     """
-    start_time = time.time()
-    
-    log_entry = {
-        "timestamp": datetime.now().isoformat(),
-        "method": request.method,
-        "url": str(request.url),
-        "client_ip": request.client.host if request.client else "unknown",
-        "user_agent": request.headers.get("user-agent", "unknown")
-    }
-    
-    logger.info(f"🌐 REQUEST: {request.method} {request.url.path} from {log_entry['client_ip']}")
+    start_time = time.monotonic()
     
     response = await call_next(request)
     
-    process_time = time.time() - start_time
-    log_entry.update({
+    process_time_ms = (time.monotonic() - start_time) * 1000.0
+    url = request.url
+    path = url.path
+    query = url.query
+    client_ip = request.client.host if request.client else "unknown"
+    log_entry = {
+        "timestamp": current_timestamp(),
+        "method": request.method,
+        "url": f"{path}?{query}" if query else path,
+        "client_ip": client_ip,
+        "user_agent": request.headers.get("user-agent", "unknown"),
         "status_code": response.status_code,
-        "process_time_ms": round(process_time * 1000, 2),
+        "process_time_ms": process_time_ms,
         "response_size": response.headers.get("content-length", "unknown")
-    })
+    }
     
-    logger.info(f"📤 RESPONSE: {response.status_code} in {log_entry['process_time_ms']}ms")
+    logger.info(
+        "🌐 %s %s from %s -> %d %.2fms",
+        request.method, path, client_ip, response.status_code, process_time_ms
+    )
     
     system_logs.append(log_entry)
-    if len(system_logs) > 100:
-        system_logs.pop(0)
     
     return response
 
@@ -94,10 +157,18 @@ class TodoCreate(BaseModel):
     
     Attributes:
         title (str): The todo item title/description
-        due_date (Optional[str]): Due date in YYYY-MM-DD format, defaults to None
+        due_date (Optional[date]): Due date in YYYY-MM-DD format, defaults to None.
+            Parsed by pydantic, so malformed dates are rejected with a 422;
+            an empty string means no due date.
     """
     title: str
-    due_date: Optional[str] = None
+    due_date: Optional[date] = None
+    
+    @field_validator("due_date", mode="before")
+    @classmethod
+    def empty_due_date_to_none(cls, value):
+        """Treat an empty due_date string as no due date, as older clients send it."""
+        return None if value == "" else value
 
 class TodoResponse(BaseModel):
     """Pydantic model for todo item responses.
@@ -107,49 +178,105 @@ class TodoResponse(BaseModel):
         title (str): The todo item title/description
         completed (bool): Whether the todo is completed
         created_at (datetime): When the todo was created
-        due_date (Optional[datetime]): Due date for the todo, defaults to None
+        due_date (Optional[date]): Due date for the todo, defaults to None
     """
     id: int
     title: str
     completed: bool
     created_at: datetime
-    due_date: Optional[datetime] = None
+    due_date: Optional[date] = None
+
+# Database connection settings, read from the environment once at import time:
+# - DB_HOST: Database host (default: 'db')
+# - DB_PORT: Database port (default: 5432)
+# - DB_NAME: Database name (default: 'tododb')
+# - DB_USER: Database user (default: 'todouser')
+# - DB_PASSWORD: Database password (default: 'todopass')
+_DB_KW = dict(
+    host=os.environ.get('DB_HOST', 'db'),
+    port=int(os.environ.get('DB_PORT', 5432)),
+    database=os.environ.get('DB_NAME', 'tododb'),
+    user=os.environ.get('DB_USER', 'todouser'),
+    password=os.environ.get('DB_PASSWORD', 'todopass')
+)
+
+# Every worker owns a pool, so pool sizes are split from a budget that stays
+# below PostgreSQL's default max_connections=100.
+DB_CONNECTION_BUDGET = 80
+DB_POOL_MAX_SIZE = max(1, min(20, DB_CONNECTION_BUDGET // WEB_CONCURRENCY))
+DB_POOL_MIN_SIZE = min(5, DB_POOL_MAX_SIZE)
+
+# Largest id a SERIAL (int4) column can hold; asyncpg rejects larger parameters
+MAX_TODO_ID = 2**31 - 1
+
+# Most items accepted by a single bulk request
+MAX_BATCH_SIZE = 1000
+
+# Statements for the hot endpoints. asyncpg prepares each statement once per
+# connection and reuses the server-side plan for identical query text.
+TODO_COLUMNS = ("id", "title", "completed", "created_at", "due_date")
+SELECT_TODOS_PAGE_SQL = (
+    "SELECT id, title, completed, created_at, due_date FROM todos "
+    "ORDER BY created_at DESC, id DESC LIMIT $1 OFFSET $2"
+)
+INSERT_TODO_SQL = "INSERT INTO todos (title, due_date) VALUES ($1, $2) RETURNING *"
+INSERT_TODOS_BULK_SQL = """
+    INSERT INTO todos (title, due_date)
+    SELECT * FROM unnest($1::varchar[], $2::date[])
+    RETURNING *
+"""
+TOGGLE_TODO_SQL = "UPDATE todos SET completed = NOT completed WHERE id = $1 RETURNING *"
+DELETE_TODO_SQL = "DELETE FROM todos WHERE id = $1 RETURNING id"
+DELETE_TODOS_BULK_SQL = "DELETE FROM todos WHERE id = ANY($1::int[]) RETURNING id"
 
-def get_db_connection():
-    """Establish connection to PostgreSQL database.
+async def create_db_pool():
+    """Create the shared asyncpg connection pool.
     
-    Uses environment variables for database configuration:
-    - DB_HOST: Database host (default: 'db')
-    - DB_PORT: Database port (default: 5432)
-    - DB_NAME: Database name (default: 'tododb')
-    - DB_USER: Database user (default: 'todouser')
-    - DB_PASSWORD: Database password (default: 'todopass')
+    Connection settings come from the module-level _DB_KW configuration.
     
     Returns:
-        psycopg2.connection: Active database connection
+        asyncpg.Pool: Pool keeping DB_POOL_MIN_SIZE to DB_POOL_MAX_SIZE open connections
         
     Raises:
         Exception: If database connection fails
     """
     try:
-        db_host = os.environ.get('DB_HOST', 'db')
-        logger.info(f"🔌 Connecting to database at {db_host}:5432")
-        
-        conn = psycopg2.connect(
-            host=db_host,
-            port=os.environ.get('DB_PORT', 5432),
-            database=os.environ.get('DB_NAME', 'tododb'),
-            user=os.environ.get('DB_USER', 'todouser'),
-            password=os.environ.get('DB_PASSWORD', 'todopass')
+        logger.info("🔌 Connecting to database at %s:%d", _DB_KW["host"], _DB_KW["port"])
+        
+        pool = await asyncpg.create_pool(
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            statement_cache_size=100,
+            **_DB_KW
         )
         
-        logger.info("✅ Database connection successful")
-        return conn
+        logger.info("✅ Database connection pool created")
+        return pool
     except Exception as e:
-        logger.error(f"❌ Database connection failed: {str(e)}")
+        logger.error("❌ Database connection failed: %s", e)
         raise
 
-def init_db():
+async def check_db_pool(pool):
+    """Verify every idle pooled connection is live before serving traffic.
+    
+    asyncpg.create_pool has already opened and authenticated min_size
+    connections; this only checks them out at once and runs SELECT 1 on each,
+    so a broken connection fails startup instead of the first request.
+    
+    Args:
+        pool (asyncpg.Pool): Freshly created connection pool
+    """
+    conns = []
+    try:
+        for _ in range(pool.get_min_size()):
+            conns.append(await pool.acquire())
+        await asyncio.gather(*(conn.fetchval("SELECT 1") for conn in conns))
+        logger.info("✅ %d pooled database connections are live", len(conns))
+    finally:
+        for conn in conns:
+            await pool.release(conn)
+
+async def init_db():
     """Initialize database schema and tables.
     
     Creates the 'todos' table if it doesn't exist and adds the 'due_date' column
@@ -161,41 +288,73 @@ def init_db():
         - completed: BOOLEAN DEFAULT FALSE
         - created_at: TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         - due_date: DATE (added later for backward compatibility)
+    
+    Every worker process runs this on startup, so the statements are
+    serialized with a transaction-scoped advisory lock.
         
     Raises:
         Exception: If database initialization fails
     """
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        # Create table if it doesn't exist
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS todos (
-                id SERIAL PRIMARY KEY,
-                title VARCHAR(255) NOT NULL,
-                completed BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Add due_date column if it doesn't exist
-        cur.execute("""
-            ALTER TABLE todos 
-            ADD COLUMN IF NOT EXISTS due_date DATE
-        """)
-        
-        conn.commit()
-        cur.close()
-        conn.close()
+        async with app.state.pool.acquire() as conn, conn.transaction():
+            await conn.execute("SELECT pg_advisory_xact_lock(hashtext('todos_init_db'))")
+            
+            # Create table if it doesn't exist
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS todos (
+                    id SERIAL PRIMARY KEY,
+                    title VARCHAR(255) NOT NULL,
+                    completed BOOLEAN DEFAULT FALSE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Add due_date column if it doesn't exist
+            await conn.execute("""
+                ALTER TABLE todos 
+                ADD COLUMN IF NOT EXISTS due_date DATE
+            """)
+            
+            # Index backing the newest-first listing and pagination. Rows from one
+            # bulk insert share created_at, so id breaks ties for stable pages.
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_todos_created_at_id
+                ON todos (created_at DESC, id DESC)
+            """)
+            
+            # Replaced by idx_todos_created_at_id
+            await conn.execute("DROP INDEX IF EXISTS idx_todos_created_at")
+        
         logger.info("✅ Database schema updated with due_date column")
         print("데이터베이스 테이블이 준비되었습니다.")
     except Exception as e:
-        logger.error(f"❌ Database initialization error: {str(e)}")
+        logger.error("❌ Database initialization error: %s", e)
         print(f"데이터베이스 초기화 오류: {e}")
 
+@app.on_event("startup")
+async def startup():
+    """Start the log listener, create and check the connection pool, then prepare the schema on application startup."""
+    log_listener.start()
+    try:
+        app.state.pool = await create_db_pool()
+        await check_db_pool(app.state.pool)
+        await init_db()
+    except Exception:
+        # Shutdown hooks don't run after a failed startup; flush queued logs first
+        log_listener.stop()
+        raise
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close every pooled connection and flush pending logs on application shutdown."""
+    pool = getattr(app.state, "pool", None)
+    if pool is not None:
+        await pool.close()
+        logger.info("🔌 Database connection pool closed")
+    log_listener.stop()
+
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint for container orchestration.
     
     Returns basic service status and timestamp for monitoring purposes.
@@ -208,10 +367,10 @@ def health_check():
             - timestamp: Current ISO timestamp
     """
     logger.info("💊 Health check requested")
-    return {"status": "ok", "service": "backend", "timestamp": datetime.now().isoformat()}
+    return {"status": "ok", "service": "backend", "timestamp": current_timestamp()}
 
 @app.get("/api/logs")
-def get_system_logs():
+async def get_system_logs():
     """Retrieve system request logs for monitoring.
     
     Returns the last 50 HTTP request logs captured by the middleware.
@@ -223,96 +382,150 @@ def get_system_logs():
             - total_requests: Total number of requests processed
     """
     logger.info("📋 System logs requested")
-    return {"logs": system_logs[-50:], "total_requests": len(system_logs)}
+    recent_logs = list(islice(system_logs, max(0, len(system_logs) - 50), None))
+    return {"logs": recent_logs, "total_requests": len(system_logs)}
+
+# Column metadata for the todos table; the schema only changes on deploy
+_columns_cache = None
+
+async def get_columns_cached(conn):
+    """Return the todos column definitions, querying information_schema once.
+    
+    An empty result (table not created yet) is not cached, so the columns
+    show up as soon as the schema exists.
+    
+    Args:
+        conn (asyncpg.Connection): Connection used on the first call
+    
+    Returns:
+        list: Column definitions with name, type, nullability and default
+    """
+    global _columns_cache
+    if _columns_cache:
+        return _columns_cache
+    columns = await conn.fetch("""
+        SELECT column_name, data_type, is_nullable, column_default
+        FROM information_schema.columns 
+        WHERE table_name = 'todos'
+        ORDER BY ordinal_position
+    """)
+    columns = [dict(column) for column in columns]
+    if columns:
+        _columns_cache = columns
+    return columns
 
 @app.get("/api/database/structure")
-def get_database_structure():
+async def get_database_structure(exact: bool = False):
     """Inspect database schema and sample data.
     
     Provides detailed information about the todos table structure,
     including column definitions, data types, and recent sample data.
     Useful for development and debugging purposes.
     
+    The row count is PostgreSQL's planner estimate (pg_class.reltuples)
+    unless an exact count is requested, since COUNT(*) scans the whole table.
+    
+    Args:
+        exact (bool): Run COUNT(*) for an exact row count (default False)
+    
     Returns:
         dict: Database structure information
             - table_name: Name of the main table ("todos")
             - columns: List of column definitions with types and constraints
-            - total_rows: Total number of records in the table
+            - total_rows: Estimated (or exact) number of records in the table
             - sample_data: Up to 10 most recent todo items
             
     Raises:
         HTTPException: 500 if database query fails
     """
     logger.info("🗄️ Database structure requested")
+    cache_key = ("structure", exact)
+    cached = response_cache.get(cache_key) if RESPONSE_CACHE_ENABLED else None
+    if cached is not None:
+        return cached
+    generation = _cache_generation
     try:
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Get table structure
-        cur.execute("""
-            SELECT column_name, data_type, is_nullable, column_default
-            FROM information_schema.columns 
-            WHERE table_name = 'todos'
-            ORDER BY ordinal_position
-        """)
-        columns = cur.fetchall()
-        
-        # Get sample data with row count
-        cur.execute("SELECT COUNT(*) as total_rows FROM todos")
-        row_count = cur.fetchone()['total_rows']
-        
-        cur.execute("SELECT * FROM todos ORDER BY created_at DESC LIMIT 10")
-        sample_data = cur.fetchall()
-        
-        cur.close()
-        conn.close()
+        async with app.state.pool.acquire() as conn:
+            # Get table structure
+            columns = await get_columns_cached(conn)
+            
+            # Get sample data with row count
+            row_count = -1
+            if not exact:
+                row_count = await conn.fetchval(
+                    "SELECT reltuples::BIGINT FROM pg_class WHERE relname = 'todos'"
+                )
+            # reltuples is -1 until the table has been vacuumed or analyzed
+            if row_count is None or row_count < 0:
+                row_count = await conn.fetchval("SELECT COUNT(*) FROM todos")
+            
+            sample_data = await conn.fetch("SELECT * FROM todos ORDER BY created_at DESC, id DESC LIMIT 10")
         
         result = {
             "table_name": "todos",
             "columns": columns,
             "total_rows": row_count,
-            "sample_data": sample_data
+            "sample_data": [dict(row) for row in sample_data]
         }
         
-        logger.info(f"✅ Database structure retrieved: {len(columns)} columns, {row_count} rows")
+        logger.info("✅ Database structure retrieved: %d columns, %s rows", len(columns), row_count)
+        if RESPONSE_CACHE_ENABLED and generation == _cache_generation:
+            response_cache[cache_key] = result
         return result
     except Exception as e:
-        logger.error(f"❌ Failed to get database structure: {str(e)}")
+        logger.error("❌ Failed to get database structure: %s", e)
         raise HTTPException(status_code=500, detail=f"데이터베이스 구조 조회 실패: {str(e)}")
 
-@app.get("/api/todos", response_model=List[TodoResponse])
-def get_todos():
-    """Retrieve all todo items from the database.
-    
-    Fetches all todos ordered by creation date (newest first).
+@app.get(
+    "/api/todos",
+    response_model=None,
+    responses={200: {"model": List[TodoResponse]}}
+)
+async def get_todos(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0)
+):
+    """Retrieve a page of todo items from the database.
+    
+    Fetches todos ordered by creation date (newest first), one page at a time
+    so the response size stays bounded as the table grows.
     This endpoint supports the main todo list display functionality.
     
+    Rows are assembled into dicts in a fixed column order and encoded with
+    orjson directly, skipping per-row pydantic validation.
+    
+    Args:
+        limit (int): Maximum number of todos to return (1-500, default 50)
+        offset (int): Number of todos to skip from the newest (default 0)
+    
     Returns:
-        List[TodoResponse]: List of all todo items with full details
+        ORJSONResponse: List of todo items with full details
         
     Raises:
         HTTPException: 500 if database query fails
     """
+    cache_key = ("todos", limit, offset)
+    cached = response_cache.get(cache_key) if RESPONSE_CACHE_ENABLED else None
+    if cached is not None:
+        return ORJSONResponse(cached)
+    generation = _cache_generation
     try:
-        logger.info("📝 Fetching all todos from database")
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+        logger.info("📝 Fetching todos from database (limit=%d, offset=%d)", limit, offset)
+        async with app.state.pool.acquire() as conn:
+            rows = await conn.fetch(SELECT_TODOS_PAGE_SQL, limit, offset)
         
-        cur.execute("SELECT * FROM todos ORDER BY created_at DESC")
-        todos = cur.fetchall()
+        logger.info("📝 Retrieved %d todos from database", len(rows))
         
-        logger.info(f"📝 Retrieved {len(todos)} todos from database")
-        
-        cur.close()
-        conn.close()
-        
-        return todos
+        todos = [dict(zip(TODO_COLUMNS, row)) for row in rows]
+        if RESPONSE_CACHE_ENABLED and generation == _cache_generation:
+            response_cache[cache_key] = todos
+        return ORJSONResponse(todos)
     except Exception as e:
-        logger.error(f"❌ Failed to fetch todos: {str(e)}")
+        logger.error("❌ Failed to fetch todos: %s", e)
         raise HTTPException(status_code=500, detail=f"할 일 목록 조회 실패: {str(e)}")
 
 @app.post("/api/todos", response_model=TodoResponse, status_code=201)
-def create_todo(todo: TodoCreate):
+async def create_todo(todo: TodoCreate):
     """Create a new todo item.
     
     Validates input data and creates a new todo in the database.
@@ -328,49 +541,79 @@ def create_todo(todo: TodoCreate):
         
     Raises:
         HTTPException: 
-            - 400 if title is empty or due_date format is invalid
+            - 400 if title is empty
+            - 422 if due_date format is invalid
             - 500 if database operation fails
     """
     try:
-        logger.info(f"➕ Creating new todo: '{todo.title}' with due_date: {todo.due_date}")
+        logger.info("➕ Creating new todo: '%s' with due_date: %s", todo.title, todo.due_date)
         
         if not todo.title.strip():
             logger.warning("⚠️ Empty todo title rejected")
             raise HTTPException(status_code=400, detail="제목이 필요합니다")
         
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Parse due_date if provided
-        due_date = None
-        if todo.due_date:
-            try:
-                due_date = datetime.strptime(todo.due_date, '%Y-%m-%d').date()
-                logger.info(f"📅 Parsed due_date: {due_date}")
-            except ValueError:
-                logger.warning(f"⚠️ Invalid date format: {todo.due_date}")
-                raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)")
-        
-        cur.execute(
-            "INSERT INTO todos (title, due_date) VALUES (%s, %s) RETURNING *",
-            (todo.title, due_date)
-        )
-        new_todo = cur.fetchone()
-        
-        conn.commit()
-        cur.close()
-        conn.close()
+        async with app.state.pool.acquire() as conn:
+            new_todo = await conn.fetchrow(INSERT_TODO_SQL, todo.title, todo.due_date)
         
-        logger.info(f"✅ Todo created successfully with ID: {new_todo['id']}, due_date: {new_todo.get('due_date')}")
-        return new_todo
+        invalidate_response_cache()
+        logger.info("✅ Todo created successfully with ID: %s, due_date: %s", new_todo["id"], new_todo["due_date"])
+        return dict(new_todo)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to create todo: {str(e)}")
+        logger.error("❌ Failed to create todo: %s", e)
         raise HTTPException(status_code=500, detail=f"할 일 추가 실패: {str(e)}")
 
+@app.post("/api/todos/bulk", response_model=List[TodoResponse], status_code=201)
+async def create_todos_bulk(todos: List[TodoCreate] = Body(..., max_length=MAX_BATCH_SIZE)):
+    """Create several todo items in a single database round-trip.
+    
+    Applies the same validation as the single create endpoint to every item,
+    then inserts all rows with one statement. Prefer this over looping
+    POST /api/todos when adding many todos at once.
+    
+    Args:
+        todos (List[TodoCreate]): Todo creation data for each new item (at most MAX_BATCH_SIZE)
+    
+    Returns:
+        List[TodoResponse]: The created todo items with generated IDs and timestamps
+        
+    Raises:
+        HTTPException: 
+            - 400 if any title is empty
+            - 422 if any due_date format is invalid or the batch is too large
+            - 500 if database operation fails
+    """
+    try:
+        logger.info("➕ Creating %d todos in bulk", len(todos))
+        
+        titles = []
+        due_dates = []
+        for todo in todos:
+            if not todo.title.strip():
+                logger.warning("⚠️ Empty todo title rejected")
+                raise HTTPException(status_code=400, detail="제목이 필요합니다")
+            
+            titles.append(todo.title)
+            due_dates.append(todo.due_date)
+        
+        if not titles:
+            return []
+        
+        async with app.state.pool.acquire() as conn:
+            new_todos = await conn.fetch(INSERT_TODOS_BULK_SQL, titles, due_dates)
+        
+        invalidate_response_cache()
+        logger.info("✅ %d todos created successfully", len(new_todos))
+        return [dict(row) for row in new_todos]
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("❌ Failed to create todos in bulk: %s", e)
+        raise HTTPException(status_code=500, detail=f"할 일 일괄 추가 실패: {str(e)}")
+
 @app.put("/api/todos/{todo_id}/toggle", response_model=TodoResponse)
-def toggle_todo(todo_id: int):
+async def toggle_todo(todo_id: int = Path(..., ge=1, le=MAX_TODO_ID)):
     """Toggle the completion status of a todo item.
     
     Switches a todo between completed and pending states.
@@ -385,40 +628,33 @@ def toggle_todo(todo_id: int):
     Raises:
         HTTPException:
             - 404 if todo with given ID doesn't exist
+            - 422 if the ID is outside the SERIAL range
             - 500 if database operation fails
     """
     try:
-        logger.info(f"🔄 Toggling todo ID: {todo_id}")
-        
-        conn = get_db_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔄 Toggling todo ID: %s", todo_id)
         
-        cur.execute(
-            "UPDATE todos SET completed = NOT completed WHERE id = %s RETURNING *",
-            (todo_id,)
-        )
-        updated_todo = cur.fetchone()
+        async with app.state.pool.acquire() as conn:
+            updated_todo = await conn.fetchrow(TOGGLE_TODO_SQL, todo_id)
         
-        if not updated_todo:
-            logger.warning(f"⚠️ Todo ID {todo_id} not found for toggle")
+        if updated_todo is None:
             raise HTTPException(status_code=404, detail="할 일을 찾을 수 없습니다")
         
-        conn.commit()
-        cur.close()
-        conn.close()
-        
-        status = "completed" if updated_todo['completed'] else "pending"
-        logger.info(f"✅ Todo ID {todo_id} toggled to {status}")
+        invalidate_response_cache()
+        if logger.isEnabledFor(logging.INFO):
+            status = "completed" if updated_todo['completed'] else "pending"
+            logger.info("✅ Todo ID %s toggled to %s", todo_id, status)
         
-        return updated_todo
+        return dict(updated_todo)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to toggle todo {todo_id}: {str(e)}")
+        logger.error("❌ Failed to toggle todo %s: %s", todo_id, e)
         raise HTTPException(status_code=500, detail=f"상태 변경 실패: {str(e)}")
 
 @app.delete("/api/todos/{todo_id}", status_code=204)
-def delete_todo(todo_id: int):
+async def delete_todo(todo_id: int = Path(..., ge=1, le=MAX_TODO_ID)):
     """Delete a todo item permanently.
     
     Removes a todo from the database completely. This action cannot be undone.
@@ -432,41 +668,83 @@ def delete_todo(todo_id: int):
     Raises:
         HTTPException:
             - 404 if todo with given ID doesn't exist
+            - 422 if the ID is outside the SERIAL range
             - 500 if database operation fails
     """
     try:
-        logger.info(f"🗑️ Deleting todo ID: {todo_id}")
+        logger.info("🗑️ Deleting todo ID: %s", todo_id)
         
-        conn = get_db_connection()
-        cur = conn.cursor()
+        async with app.state.pool.acquire() as conn:
+            deleted_id = await conn.fetchval(DELETE_TODO_SQL, todo_id)
         
-        cur.execute("DELETE FROM todos WHERE id = %s", (todo_id,))
-        deleted_count = cur.rowcount
-        
-        if deleted_count == 0:
-            logger.warning(f"⚠️ Todo ID {todo_id} not found for deletion")
+        if deleted_id is None:
+            logger.warning("⚠️ Todo ID %s not found for deletion", todo_id)
             raise HTTPException(status_code=404, detail="할 일을 찾을 수 없습니다")
         
-        conn.commit()
-        cur.close()
-        conn.close()
-        
-        logger.info(f"✅ Todo ID {todo_id} deleted successfully")
+        invalidate_response_cache()
+        logger.info("✅ Todo ID %s deleted successfully", todo_id)
         return None
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to delete todo {todo_id}: {str(e)}")
+        logger.error("❌ Failed to delete todo %s: %s", todo_id, e)
         raise HTTPException(status_code=500, detail=f"삭제 실패: {str(e)}")
 
+@app.post("/api/todos/delete_many", response_model=List[int])
+async def delete_todos_bulk(
+    todo_ids: List[conint(ge=1, le=MAX_TODO_ID)] = Body(..., max_length=MAX_BATCH_SIZE)
+):
+    """Delete several todo items in a single database round-trip.
+    
+    IDs that don't exist are skipped rather than failing the request;
+    compare the returned IDs with the requested ones to find them.
+    
+    Args:
+        todo_ids (List[int]): Unique identifiers of the todos to delete (at most MAX_BATCH_SIZE)
+    
+    Returns:
+        List[int]: IDs of the todos that were actually deleted
+        
+    Raises:
+        HTTPException:
+            - 422 if an ID is outside the SERIAL range or the batch is too large
+            - 500 if database operation fails
+    """
+    try:
+        logger.info("🗑️ Deleting %d todos in bulk", len(todo_ids))
+        
+        if not todo_ids:
+            return []
+        
+        async with app.state.pool.acquire() as conn:
+            rows = await conn.fetch(DELETE_TODOS_BULK_SQL, todo_ids)
+        
+        deleted_ids = [row[0] for row in rows]
+        if deleted_ids:
+            invalidate_response_cache()
+        
+        logger.info("✅ %d of %d todos deleted successfully", len(deleted_ids), len(todo_ids))
+        return deleted_ids
+    except Exception as e:
+        logger.error("❌ Failed to delete todos in bulk: %s", e)
+        raise HTTPException(status_code=500, detail=f"일괄 삭제 실패: {str(e)}")
+
 if __name__ == '__main__':
     """Application entry point when run directly.
     
-    Initializes the database schema and starts the Uvicorn ASGI server.
-    Reads port from PORT environment variable (defaults to 5000).
+    Starts the Uvicorn ASGI server with uvloop and httptools; each worker's
+    startup hook creates its connection pool and initializes the database schema.
+    Reads port from PORT environment variable (defaults to 5000) and the
+    worker count from WEB_CONCURRENCY (defaults to 1).
     """
     import uvicorn
-    init_db()
     
     port = int(os.environ.get('PORT', 5000))
-    uvicorn.run(app, host='0.0.0.0', port=port)
\ No newline at end of file
+    uvicorn.run(
+        "app:app",
+        host='0.0.0.0',
+        port=port,
+        workers=WEB_CONCURRENCY,
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file
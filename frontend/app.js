@@ -48,10 +48,17 @@ function logToConsole(level, message, data = null) {
     localStorage.setItem('frontendLogs', JSON.stringify(logs));
 }
 
+// Number of todos requested per page from /api/todos
+const TODO_PAGE_SIZE = 50;
+
+// Number of pages currently shown; grows when "더 보기" is clicked
+let todoPageCount = 1;
+
 /**
- * Load all todo items from the backend API.
+ * Load the currently shown pages of todo items from the backend API.
  * 
- * Fetches todos from the /api/todos endpoint and displays them in the UI.
+ * Fetches todos page by page from the /api/todos endpoint and displays them in the UI.
+ * Every shown page is reloaded so items don't disappear after a modification.
  * Includes performance timing and comprehensive error handling.
  * Automatically called on page load and after todo modifications.
  */
@@ -59,25 +66,39 @@ async function loadTodos() {
     try {
         logToConsole('INFO', '📝 Requesting todos from backend API');
         
+        const todos = [];
+        let hasMore = false;
         const startTime = performance.now();
-        const response = await fetch(`${API_URL}/todos`);
+        for (let page = 0; page < todoPageCount; page++) {
+            const offset = page * TODO_PAGE_SIZE;
+            const response = await fetch(`${API_URL}/todos?limit=${TODO_PAGE_SIZE}&offset=${offset}`);
+            const pageTodos = await response.json();
+            todos.push(...pageTodos);
+            hasMore = pageTodos.length === TODO_PAGE_SIZE;
+            if (!hasMore) break;
+        }
         const endTime = performance.now();
         
-        logToConsole('INFO', `📡 API Response received in ${Math.round(endTime - startTime)}ms`, {
-            status: response.status,
-            statusText: response.statusText
-        });
-        
-        const todos = await response.json();
-        
+        logToConsole('INFO', `📡 API Response received in ${Math.round(endTime - startTime)}ms`);
         logToConsole('INFO', `📊 Received ${todos.length} todos from backend`);
         displayTodos(todos);
+        document.getElementById('loadMoreBtn').style.display = hasMore ? 'block' : 'none';
     } catch (error) {
         logToConsole('ERROR', '❌ Failed to load todos', error.message);
         console.error('할 일 목록을 불러오는데 실패했습니다:', error);
     }
 }
 
+/**
+ * Show one more page of todo items.
+ * 
+ * Called by the "더 보기" button below the todo list.
+ */
+function loadMoreTodos() {
+    todoPageCount++;
+    loadTodos();
+}
+
 /**
  * Render todo items in the user interface.
  * 
@@ -102,7 +123,8 @@ function displayTodos(todos) {
         // Format due date
         let dueDateHtml = '';
         if (todo.due_date) {
-            const dueDate = new Date(todo.due_date);
+            // due_date is a plain YYYY-MM-DD date; parse it as local midnight
+            const dueDate = new Date(`${todo.due_date}T00:00:00`);
             const today = new Date();
             const isToday = dueDate.toDateString() === today.toDateString();
             const isOverdue = dueDate < today && !isToday;
@@ -351,8 +373,8 @@ async function loadSystemLogs() {
                     return `
                     <div class="log-entry ${statusClass}">
                         [${time}] 
-                        <strong>GET</strong> ${log.url.split('localhost:5000')[1] || log.url} 
-                        → ${log.status_code} (${log.process_time_ms}ms)
+                        <strong>GET</strong> ${log.url} 
+                        → ${log.status_code} (${log.process_time_ms.toFixed(2)}ms)
                         <br><small>Client: ${log.client_ip}</small>
                     </div>
                 `;
@@ -376,8 +398,8 @@ async function loadSystemLogs() {
                     return `
                     <div class="log-entry ${statusClass}">
                         [${time}] 
-                        <strong style="color: ${methodColor}">${log.method}</strong> ${log.url.split('localhost:5000')[1] || log.url} 
-                        → ${log.status_code} (${log.process_time_ms}ms)
+                        <strong style="color: ${methodColor}">${log.method}</strong> ${log.url} 
+                        → ${log.status_code} (${log.process_time_ms.toFixed(2)}ms)
                         <br><small>Client: ${log.client_ip}</small>
                     </div>
                 `;
@@ -466,7 +488,7 @@ async function loadDatabaseInfo() {
                                         if (col === 'created_at' && value) {
                                             value = new Date(value).toLocaleString('ko-KR');
                                         } else if (col === 'due_date' && value) {
-                                            value = new Date(value).toLocaleDateString('ko-KR');
+                                            value = new Date(`${value}T00:00:00`).toLocaleDateString('ko-KR');
                                         } else if (col === 'completed') {
                                             value = value ? '✅ 완료' : '⏳ 진행중';
                                         }